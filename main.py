@@ -13,17 +13,40 @@ Future enhancements:
 - Webhook integrations
 """
 import os
+import re
 import sys
 import json
 import time
+import codecs
+import functools
+import threading
+import unicodedata
 import logging
-from typing import Optional, List, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import AbstractSet, Optional, List, Set
 from urllib.parse import urlparse
 
 try:
     import boto3  # type: ignore
+    from botocore.config import Config as BotoConfig  # type: ignore
 except ImportError:
     boto3 = None  # type: ignore
+    BotoConfig = None  # type: ignore
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
+try:
+    import ahocorasick  # type: ignore
+except ImportError:
+    ahocorasick = None  # type: ignore
+
+try:
+    import hyperscan  # type: ignore
+except ImportError:
+    hyperscan = None  # type: ignore
 
 logging.basicConfig(
     level=os.getenv("LOG_LEVEL", "INFO"),
@@ -33,33 +56,87 @@ logger = logging.getLogger("alerts")
 
 MINIMAL_LOGS = str(os.getenv("MINIMAL_LOGS", "true")).lower() in ("1", "true", "yes", "on")
 
+# Number of concurrent SQS consumer threads
+ALERT_WORKERS = max(1, int(os.getenv("ALERT_WORKERS", "8") or "8"))
+
+# Patterns for _slugify_for_s3
+_RE_WS = re.compile(r"\s+")
+_RE_BAD = re.compile(r"[^a-z0-9\-_.]")
+_RE_DASH = re.compile(r"-+")
+
+# Size of each S3 read when streaming documents through the matcher
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Per-thread Hyperscan scratch spaces (see _hyperscan_scratch)
+_HS_LOCAL = threading.local()
+
+# Shared pool for fetching an event's transcript and analysis in parallel,
+# sized so every consumer worker can have both documents in flight
+_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=ALERT_WORKERS * 2, thread_name_prefix="s3-fetch")
+
+
+def _loads(data):
+    """Parse JSON with orjson's C parser when installed.
+    
+    Falls back to json.loads for input only the stdlib accepts (NaN/Infinity,
+    lone surrogate escapes), so json.JSONDecodeError means both rejected it.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _client_config(**overrides):
+    """Shared botocore config: pooled keep-alive connections and adaptive retries."""
+    options = {
+        "max_pool_connections": 32,
+        "retries": {"max_attempts": 3, "mode": "adaptive"},
+        "tcp_keepalive": True,
+    }
+    options.update(overrides)
+    return BotoConfig(**options)
 
+
+@functools.lru_cache(maxsize=1)
 def s3_client():
-    """Create S3 client."""
-    return boto3.client("s3", region_name=os.getenv("AWS_REGION", "us-east-1"))
+    """Return the shared S3 client (created on first use).
+    
+    The pool leaves room for every worker's concurrent fetches so GETs reuse
+    warm TLS connections. Timeouts are short so a stalled GET fails (and is
+    retried) instead of holding a worker.
+    """
+    config = _client_config(
+        max_pool_connections=max(32, ALERT_WORKERS * 4),
+        connect_timeout=3,
+        read_timeout=15,
+    )
+    return boto3.client("s3", region_name=os.getenv("AWS_REGION", "us-east-1"), config=config)
 
 
+@functools.lru_cache(maxsize=1)
 def sqs_client():
-    """Create SQS client."""
-    return boto3.client("sqs", region_name=os.getenv("AWS_REGION", "us-east-1"))
+    """Return the shared SQS client (created on first use)."""
+    return boto3.client("sqs", region_name=os.getenv("AWS_REGION", "us-east-1"), config=_client_config())
 
 
+@functools.lru_cache(maxsize=1024)
 def _slugify_for_s3(value: str, max_length: int = 80) -> str:
     """Slugify a string for use in S3 keys or dictionary lookups.
     
     IMPORTANT: This must match the analyzer's _slugify_for_s3 exactly
     so that commission names are normalized identically for keyword matching.
     """
-    import re
-    import unicodedata
     v = (value or "").strip().lower()
     # Normalize unicode characters (NFD = decompose accented chars)
     # Then filter out combining marks to get base ASCII characters
     v = unicodedata.normalize('NFD', v)
     v = ''.join(c for c in v if unicodedata.category(c) != 'Mn')
-    v = re.sub(r"\s+", "-", v)
-    v = re.sub(r"[^a-z0-9\-_.]", "", v)
-    v = re.sub(r"-+", "-", v).strip("-._")
+    v = _RE_WS.sub("-", v)
+    v = _RE_BAD.sub("", v)
+    v = _RE_DASH.sub("-", v).strip("-._")
     if len(v) > max_length:
         v = v[:max_length].rstrip("-._")
     return v or "session"
@@ -73,27 +150,109 @@ def parse_s3_uri(uri: str) -> tuple[str, str]:
     return parsed.netloc, parsed.path.lstrip("/")
 
 
+def _strip_bom(content: bytes) -> bytes:
+    """Drop a leading UTF-8 BOM (json.loads accepted one; orjson does not)."""
+    if content.startswith(codecs.BOM_UTF8):
+        return content[len(codecs.BOM_UTF8):]
+    return content
+
+
+def _looks_like_json(prefix: bytes) -> bool:
+    """Whether a body starting with prefix should be parsed as JSON."""
+    return _strip_bom(prefix[:32]).lstrip()[:1] in (b"{", b"[")
+
+
+def _decode_document(content: bytes) -> str:
+    """Decode a fetched S3 object into searchable text."""
+    content = _strip_bom(content)
+    # Only attempt a JSON parse (for transcripts) when the body looks like
+    # JSON, so large HTML analyses skip a parse that is bound to fail
+    if _looks_like_json(content):
+        try:
+            data = _loads(content)
+            # AssemblyAI transcript format
+            if isinstance(data, dict) and "text" in data:
+                return data["text"]
+            # \uXXXX escapes (e.g. accented letters) only match once decoded
+            if b"\\u" in content:
+                return json.dumps(data, ensure_ascii=False)
+        except json.JSONDecodeError:
+            pass
+    # Plain text, HTML, or other JSON: search the document as stored
+    return content.decode("utf-8", errors="replace")
+
+
 def fetch_s3_text(s3_uri: str) -> Optional[str]:
     """Fetch text content from S3."""
     try:
         bucket, key = parse_s3_uri(s3_uri)
         s3 = s3_client()
         response = s3.get_object(Bucket=bucket, Key=key)
-        content = response["Body"].read()
-        # Try to decode as JSON first (for transcripts)
-        try:
-            data = json.loads(content)
-            # AssemblyAI transcript format
-            if isinstance(data, dict) and "text" in data:
-                return data["text"]
-            # If it's a dict but no "text" field, return JSON string
-            return json.dumps(data, ensure_ascii=False)
-        except json.JSONDecodeError:
-            # Plain text or HTML
-            return content.decode("utf-8")
+        return _decode_document(response["Body"].read())
+    except Exception as e:
+        logger.warning("Failed to fetch %s: %s", s3_uri, e)
+        return None
+
+
+def _build_automaton(keywords: AbstractSet[str]):
+    """Build an Aho-Corasick automaton over keywords.
+
+    When pyahocorasick is not installed, returns a compiled regex alternation
+    of the keywords instead, which still scans the text in one C-level pass.
+    Returns None when there are no keywords.
+    """
+    if not keywords:
+        return None
+    if ahocorasick is None:
+        # Longest first so the longer keyword is captured at a shared start;
+        # the lookahead makes matches overlap like substring search
+        alternation = "|".join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))
+        return re.compile(f"(?=({alternation}))")
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_hyperscan(keywords: AbstractSet[str]):
+    """Compile keywords into a Hyperscan database.
+
+    Returns (database, id_to_keyword), or None when hyperscan is not installed,
+    there are no keywords, or compilation fails.
+    """
+    if hyperscan is None or not keywords:
+        return None
+    id_to_kw = sorted(keywords)
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[re.escape(kw).encode("utf-8") for kw in id_to_kw],
+            ids=list(range(len(id_to_kw))),
+            elements=len(id_to_kw),
+            flags=[flags] * len(id_to_kw),
+        )
     except Exception as e:
-        logger.warning(f"Failed to fetch {s3_uri}: {e}")
+        logger.warning("Failed to compile hyperscan database: %s", e)
         return None
+    return db, id_to_kw
+
+
+def _hyperscan_scratch(db):
+    """Return this thread's scratch space for db, allocating it on first use.
+    
+    A database's built-in scratch can only serve one scan at a time, and
+    scans run concurrently on the fetch executor threads.
+    """
+    scratches = getattr(_HS_LOCAL, "scratches", None)
+    if scratches is None:
+        scratches = _HS_LOCAL.scratches = {}
+    # Keep db referenced alongside its scratch so its id can't be reused
+    entry = scratches.get(id(db))
+    if entry is None:
+        entry = scratches[id(db)] = (db, hyperscan.Scratch(db))
+    return entry[1]
 
 
 def load_keywords() -> dict:
@@ -108,7 +267,12 @@ def load_keywords() -> dict:
         "global": ["keyword1", "keyword2"],
         "commissions": {
             "commission-name": ["keyword3", "keyword4"]
-        }
+        },
+        "automaton": <Aho-Corasick automaton (or regex fallback) over all keywords, or None>,
+        "hyperscan": <(database, id_to_keyword) over all keywords, or None>,
+        "automata": {},  # per-commission automata, built lazily
+        "effective_default": frozenset(<global keywords>),
+        "effective": {"commission-name": frozenset(<global + commission keywords>)}
     }
     """
     result = {"global": set(), "commissions": {}}
@@ -128,7 +292,7 @@ def load_keywords() -> dict:
             if keywords_file.startswith("s3://"):
                 content = fetch_s3_text(keywords_file)
                 if content:
-                    data = json.loads(content)
+                    data = _loads(content)
             elif keywords_file.startswith("arn:aws:ssm:") or keywords_file.startswith("/"):
                 # SSM Parameter (ARN or parameter name)
                 import boto3
@@ -136,7 +300,7 @@ def load_keywords() -> dict:
                 param_name = keywords_file.split("parameter")[-1] if "parameter" in keywords_file else keywords_file
                 response = ssm.get_parameter(Name=param_name)
                 content = response["Parameter"]["Value"]
-                data = json.loads(content)
+                data = _loads(content)
             else:
                 with open(keywords_file, "r", encoding="utf-8") as f:
                     data = json.load(f)
@@ -174,21 +338,115 @@ def load_keywords() -> dict:
                     if kw:
                         result["global"].add(kw)
         except Exception as e:
-            logger.warning(f"Failed to load keywords from file {keywords_file}: {e}")
+            logger.warning("Failed to load keywords from file %s: %s", keywords_file, e)
+    
+    # Freeze and intern the keywords: the sets are shared read-only across
+    # workers, and the strings matchers hand back are then these same objects
+    result["global"] = frozenset(sys.intern(kw) for kw in result["global"])
+    result["commissions"] = {
+        commission: frozenset(sys.intern(kw) for kw in kws)
+        for commission, kws in result["commissions"].items()
+    }
+    
+    # Single automaton over the union of all keywords, so each document is
+    # scanned in one pass regardless of how many keywords are configured
+    all_keywords = set(result["global"])
+    for kws in result["commissions"].values():
+        all_keywords.update(kws)
+    result["automaton"] = _build_automaton(all_keywords)
+    result["hyperscan"] = _build_hyperscan(all_keywords)
+    result["automata"] = {}
+    
+    # Active keyword set per commission (global + commission-specific), so
+    # events don't rebuild it
+    result["effective_default"] = frozenset(result["global"])
+    result["effective"] = {
+        slug: frozenset(result["global"] | kws) for slug, kws in result["commissions"].items()
+    }
     
     return result
 
 
-def check_keywords(text: str, keywords: Set[str]) -> List[str]:
+def _commission_automaton(keywords_config: dict, committee_slug: str, keywords: AbstractSet[str]):
+    """Return the automaton for a commission's keywords, building it on first use."""
+    automata = keywords_config.setdefault("automata", {})
+    if committee_slug not in automata:
+        automata[committee_slug] = _build_automaton(keywords)
+    return automata[committee_slug]
+
+
+def _normalize_for_matching(text: str, hyperscan_db=None) -> str:
+    """Prepare a fetched document for check_keywords.
+    
+    Hyperscan matches caselessly, so the text is passed through untouched;
+    the other matchers need it lowercased. Call once per document.
+    """
+    if hyperscan_db is not None:
+        return text
+    return text.lower()
+
+
+def check_keywords(text_lower: str, keywords: AbstractSet[str], automaton=None, hyperscan_db=None) -> List[str]:
     """Check if any keywords appear in text (case-insensitive, whole-word matching).
     
+    text_lower must come from _normalize_for_matching so large documents are
+    lowercased at most once.
+    
+    Prefers the Hyperscan database, then the Aho-Corasick automaton (or its
+    regex fallback); each scans the text in a single pass and the hits are
+    filtered down to the active keywords.
+    
     Returns list of matched keywords.
     """
-    if not text or not keywords:
+    if not text_lower or not keywords:
         return []
     
-    text_lower = text.lower()
-    matches = []
+    # Each matcher stops scanning as soon as every active keyword was seen
+    remaining = set(keywords)
+    matches: List[str] = []
+    
+    if hyperscan_db is not None:
+        db, id_to_kw = hyperscan_db
+        
+        def on_match(kw_id, start, end, flags, context):
+            kw = id_to_kw[kw_id]
+            if kw in remaining:
+                remaining.discard(kw)
+                matches.append(kw)
+            # A truthy return value halts the scan
+            return not remaining
+        
+        try:
+            db.scan(text_lower.encode("utf-8", errors="replace"), match_event_handler=on_match, scratch=_hyperscan_scratch(db))
+        except hyperscan.ScanTerminated:
+            pass
+        return matches
+    
+    if isinstance(automaton, re.Pattern):
+        seen: Set[str] = set()
+        for m in automaton.finditer(text_lower):
+            found = m.group(1)
+            if found in seen:
+                continue
+            seen.add(found)
+            # A keyword that is a prefix of a longer match is shadowed by the
+            # alternation, so count every active keyword contained in a match
+            hits = [kw for kw in remaining if kw in found]
+            if hits:
+                remaining.difference_update(hits)
+                matches.extend(hits)
+                if not remaining:
+                    break
+        return matches
+    
+    if automaton is not None:
+        for _, kw in automaton.iter(text_lower):
+            if kw in remaining:
+                remaining.discard(kw)
+                matches.append(kw)
+                if not remaining:
+                    break
+        return matches
     
     for keyword in keywords:
         # Simple substring search for now
@@ -199,6 +457,62 @@ def check_keywords(text: str, keywords: Set[str]) -> List[str]:
     return matches
 
 
+def scan_stream(s3_uri: str, keywords: AbstractSet[str], automaton=None, hyperscan_db=None) -> Optional[Set[str]]:
+    """Scan an S3 object for keywords while it downloads.
+    
+    Plain text and HTML are matched chunk by chunk, carrying over the last
+    (longest keyword - 1) characters so matches spanning a chunk boundary are
+    still found. JSON documents (transcripts) are read whole and parsed, since
+    only their "text" field is searched.
+    
+    Returns the set of matched keywords, or None if the object can't be read.
+    Only S3/read errors are handled here; matcher errors propagate so the
+    message is retried instead of the document silently counting as unreadable.
+    """
+    try:
+        bucket, key = parse_s3_uri(s3_uri)
+        s3 = s3_client()
+        body = s3.get_object(Bucket=bucket, Key=key)["Body"]
+        chunks = body.iter_chunks(STREAM_CHUNK_SIZE)
+        head = next(chunks, b"")
+        if _looks_like_json(head):
+            head += b"".join(chunks)
+    except Exception as e:
+        logger.warning("Failed to fetch %s: %s", s3_uri, e)
+        return None
+    
+    if _looks_like_json(head):
+        document = _decode_document(head)
+        # Empty transcript (e.g. {"text": null} for a failed job): nothing to scan
+        if not document:
+            return set()
+        text = _normalize_for_matching(document, hyperscan_db)
+        return set(check_keywords(text, keywords, automaton, hyperscan_db))
+    
+    overlap = max((len(kw) for kw in keywords), default=1) - 1
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    matches: Set[str] = set()
+    tail = ""
+    chunk: Optional[bytes] = head
+    while chunk is not None:
+        text = tail + _normalize_for_matching(decoder.decode(chunk), hyperscan_db)
+        matches.update(check_keywords(text, keywords - matches, automaton, hyperscan_db))
+        if len(matches) == len(keywords):
+            # Every keyword already matched; skip the rest of the download
+            body.close()
+            return matches
+        tail = text[-overlap:] if overlap else ""
+        try:
+            chunk = next(chunks, None)
+        except Exception as e:
+            logger.warning("Failed to fetch %s: %s", s3_uri, e)
+            return None
+    # Flush any bytes the decoder was still holding
+    text = tail + _normalize_for_matching(decoder.decode(b"", final=True), hyperscan_db)
+    matches.update(check_keywords(text, keywords - matches, automaton, hyperscan_db))
+    return matches
+
+
 def process_analysis_event(event: dict, keywords_config: dict) -> None:
     """Process a single analysis completion event.
     
@@ -211,23 +525,28 @@ def process_analysis_event(event: dict, keywords_config: dict) -> None:
     committee = metadata.get("committee") or metadata.get("title") or ""
     
     if not MINIMAL_LOGS:
-        logger.info(f"Processing run_id={run_id} source={source} committee={committee}")
+        logger.info("Processing run_id=%s source=%s committee=%s", run_id, source, committee)
     
-    # Build combined keyword set: global + commission-specific
-    keywords_to_check: Set[str] = set(keywords_config.get("global", set()))
+    # Combined keyword set: global + commission-specific (precomputed)
+    keywords_to_check: AbstractSet[str] = keywords_config.get("effective_default", frozenset())
+    automaton = keywords_config.get("automaton")
+    hyperscan_db = keywords_config.get("hyperscan")
     
-    # Add commission-specific keywords if available
+    # Use the commission's keyword set if available
     if committee:
         committee_slug = _slugify_for_s3(committee)
-        if committee_slug in keywords_config.get("commissions", {}):
-            commission_keywords = keywords_config["commissions"][committee_slug]
-            keywords_to_check.update(commission_keywords)
-            if not MINIMAL_LOGS:
-                logger.debug(f"Added {len(commission_keywords)} commission-specific keywords for '{committee_slug}'")
+        if committee_slug in keywords_config.get("effective", {}):
+            keywords_to_check = keywords_config["effective"][committee_slug]
+            # check_keywords only falls back to the automaton without Hyperscan
+            if hyperscan_db is None:
+                automaton = _commission_automaton(keywords_config, committee_slug, keywords_to_check)
+            logger.debug(
+                "Added %d commission-specific keywords for '%s'",
+                len(keywords_config["commissions"][committee_slug]), committee_slug
+            )
     
     if not keywords_to_check:
-        if not MINIMAL_LOGS:
-            logger.debug(f"No keywords to check for run_id={run_id}")
+        logger.debug("No keywords to check for run_id=%s", run_id)
         return
     
     # Extract S3 URIs
@@ -242,31 +561,26 @@ def process_analysis_event(event: dict, keywords_config: dict) -> None:
     all_matches: Set[str] = set()
     match_locations: List[str] = []
     
-    # Check transcript
+    # Fetch and scan transcript and analysis HTML concurrently
+    scans = []
     if transcript_uri:
-        if not MINIMAL_LOGS:
-            logger.debug(f"Fetching transcript: {transcript_uri}")
-        transcript_text = fetch_s3_text(transcript_uri)
-        if transcript_text:
-            matches = check_keywords(transcript_text, keywords_to_check)
-            if matches:
-                all_matches.update(matches)
-                match_locations.append("transcript")
-                if not MINIMAL_LOGS:
-                    logger.info(f"Found {len(matches)} keyword(s) in transcript: {matches}")
-    
-    # Check analysis HTML
+        logger.debug("Fetching transcript: %s", transcript_uri)
+        scans.append(("transcript", _FETCH_EXECUTOR.submit(
+            scan_stream, transcript_uri, keywords_to_check, automaton, hyperscan_db
+        )))
     if analysis_html_uri:
-        if not MINIMAL_LOGS:
-            logger.debug(f"Fetching analysis: {analysis_html_uri}")
-        analysis_text = fetch_s3_text(analysis_html_uri)
-        if analysis_text:
-            matches = check_keywords(analysis_text, keywords_to_check)
-            if matches:
-                all_matches.update(matches)
-                match_locations.append("analysis")
-                if not MINIMAL_LOGS:
-                    logger.info(f"Found {len(matches)} keyword(s) in analysis: {matches}")
+        logger.debug("Fetching analysis: %s", analysis_html_uri)
+        scans.append(("analysis", _FETCH_EXECUTOR.submit(
+            scan_stream, analysis_html_uri, keywords_to_check, automaton, hyperscan_db
+        )))
+    
+    for label, future in scans:
+        matches = future.result()
+        if matches:
+            all_matches.update(matches)
+            match_locations.append(label)
+            if not MINIMAL_LOGS:
+                logger.info("Found %d keyword(s) in %s: %s", len(matches), label, sorted(matches))
     
     # Generate alert if any matches found
     if all_matches:
@@ -291,14 +605,107 @@ def process_analysis_event(event: dict, keywords_config: dict) -> None:
         )
         
         print(alert_msg, flush=True)
-        logger.info(f"ALERT: {len(all_matches)} keyword(s) matched for run_id={run_id}")
+        logger.info("ALERT: %d keyword(s) matched for run_id=%s", len(all_matches), run_id)
         
         # TODO: Send email notification
         # TODO: Post to webhook
         # TODO: Store alert in database
     else:
         if not MINIMAL_LOGS:
-            logger.info(f"No keyword matches for run_id={run_id}")
+            logger.info("No keyword matches for run_id=%s", run_id)
+
+
+def delete_messages(sqs, queue_url: str, entries: List[dict]) -> None:
+    """Delete a batch of processed messages (up to 10) in one SQS call.
+    
+    Entries that SQS reports as failed are logged; those messages become
+    visible again once their visibility timeout expires and will be retried.
+    """
+    try:
+        resp = sqs.delete_message_batch(QueueUrl=queue_url, Entries=entries)
+    except Exception as e:
+        logger.warning("Failed to delete %d message(s): %s", len(entries), e)
+        return
+    for failure in resp.get("Failed", []):
+        logger.warning("Failed to delete message entry %s: %s", failure.get("Id"), failure.get("Message"))
+
+
+def extend_visibility(sqs, queue_url: str, msgs: List[dict], vis_timeout: int, start: int = 0) -> None:
+    """Extend visibility of msgs[start:] in one SQS call."""
+    try:
+        resp = sqs.change_message_visibility_batch(
+            QueueUrl=queue_url,
+            Entries=[
+                {"Id": str(i), "ReceiptHandle": msg["ReceiptHandle"], "VisibilityTimeout": vis_timeout}
+                for i, msg in enumerate(msgs[start:], start)
+            ]
+        )
+    except Exception as e:
+        logger.warning("Failed to extend visibility: %s", e)
+        return
+    for failure in resp.get("Failed", []):
+        logger.warning("Failed to extend visibility for entry %s: %s", failure.get("Id"), failure.get("Message"))
+
+
+def poll_once(sqs, queue_url: str, keywords_config: dict, vis_timeout: int) -> None:
+    """Receive one batch of messages, process them, and delete the handled ones."""
+    # Long poll for the maximum 20s to cut empty receives while idle.
+    # No message attributes are requested; only the Body is used.
+    # VisibilityTimeout on the receive itself saves a separate extend call.
+    resp = sqs.receive_message(
+        QueueUrl=queue_url,
+        MaxNumberOfMessages=10,
+        WaitTimeSeconds=20,
+        VisibilityTimeout=vis_timeout
+    )
+    
+    msgs = resp.get("Messages", [])
+    if not msgs:
+        return
+    
+    visible_at = time.monotonic() + vis_timeout
+    to_delete: List[dict] = []
+    for i, msg in enumerate(msgs):
+        receipt = msg["ReceiptHandle"]
+        body = msg.get("Body", "{}")
+        
+        # Slow batch: delete what's already handled, then re-extend the
+        # messages not yet processed, before any become visible to other
+        # consumers again
+        if visible_at - time.monotonic() < vis_timeout / 2:
+            if to_delete:
+                delete_messages(sqs, queue_url, to_delete)
+                to_delete = []
+            extend_visibility(sqs, queue_url, msgs, vis_timeout, start=i)
+            visible_at = time.monotonic() + vis_timeout
+        
+        try:
+            event = _loads(body)
+            process_analysis_event(event, keywords_config)
+            
+            # Delete message after successful processing
+            to_delete.append({"Id": str(i), "ReceiptHandle": receipt})
+            
+        except json.JSONDecodeError as e:
+            logger.error("Invalid JSON in message: %s", e)
+            # Delete malformed messages
+            to_delete.append({"Id": str(i), "ReceiptHandle": receipt})
+        except Exception as e:
+            logger.exception("Error processing message: %s", e)
+            # Leave message for retry (visibility timeout will expire)
+    
+    if to_delete:
+        delete_messages(sqs, queue_url, to_delete)
+
+
+def _worker_loop(sqs, queue_url: str, keywords_config: dict, vis_timeout: int, stop: threading.Event) -> None:
+    """Poll the queue until stop is set."""
+    while not stop.is_set():
+        try:
+            poll_once(sqs, queue_url, keywords_config, vis_timeout)
+        except Exception as e:
+            logger.exception("Error in worker loop: %s", e)
+            stop.wait(5)
 
 
 def consume_loop():
@@ -321,65 +728,44 @@ def consume_loop():
         logger.warning("No keywords configured. Set ALERT_KEYWORDS or ALERT_KEYWORDS_FILE.")
         logger.warning("Service will run but no alerts will be generated.")
     else:
-        logger.info(f"Loaded {global_count} global keyword(s) and {commission_count} commission-specific keyword set(s)")
-        if not MINIMAL_LOGS:
-            logger.debug(f"Global keywords: {sorted(keywords_config.get('global', set()))}")
+        logger.info("Loaded %d global keyword(s) and %d commission-specific keyword set(s)", global_count, commission_count)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Global keywords: %s", sorted(keywords_config.get("global", set())))
             for comm, kws in keywords_config.get("commissions", {}).items():
-                logger.debug(f"Commission '{comm}': {sorted(kws)}")
+                logger.debug("Commission '%s': %s", comm, sorted(kws))
     
     vis_timeout = int(os.getenv("SQS_VISIBILITY_TIMEOUT_SECONDS", "300") or "300")
     sqs = sqs_client()
+    # Create the S3 client up front rather than racing to build it from fetch threads
+    s3_client()
     
-    logger.info(f"Starting alerts service, polling {queue_url}")
+    logger.info("Starting alerts service with %d worker(s), polling %s", ALERT_WORKERS, queue_url)
     
-    while True:
-        try:
-            resp = sqs.receive_message(
-                QueueUrl=queue_url,
-                MaxNumberOfMessages=1,
-                WaitTimeSeconds=10,
-                MessageAttributeNames=["All"]
-            )
-            
-            msgs = resp.get("Messages", [])
-            if not msgs:
-                continue
-            
-            for msg in msgs:
-                receipt = msg["ReceiptHandle"]
-                body = msg.get("Body", "{}")
-                
-                try:
-                    # Extend visibility immediately
-                    sqs.change_message_visibility(
-                        QueueUrl=queue_url,
-                        ReceiptHandle=receipt,
-                        VisibilityTimeout=vis_timeout
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to extend visibility: {e}")
-                
-                try:
-                    event = json.loads(body)
-                    process_analysis_event(event, keywords_config)
-                    
-                    # Delete message after successful processing
-                    sqs.delete_message(QueueUrl=queue_url, ReceiptHandle=receipt)
-                    
-                except json.JSONDecodeError as e:
-                    logger.error(f"Invalid JSON in message: {e}")
-                    # Delete malformed messages
-                    sqs.delete_message(QueueUrl=queue_url, ReceiptHandle=receipt)
-                except Exception as e:
-                    logger.exception(f"Error processing message: {e}")
-                    # Leave message for retry (visibility timeout will expire)
-        
-        except KeyboardInterrupt:
-            logger.info("Shutting down (KeyboardInterrupt)")
-            break
-        except Exception as e:
-            logger.exception(f"Error in main loop: {e}")
-            time.sleep(5)
+    # Each worker runs its own receive -> process -> delete loop. boto3
+    # clients are thread-safe, and keywords_config is only read apart from
+    # the per-commission automata memo, where a racing build is harmless
+    stop = threading.Event()
+    workers = [
+        threading.Thread(
+            target=_worker_loop,
+            args=(sqs, queue_url, keywords_config, vis_timeout, stop),
+            name=f"alerts-worker-{i}",
+            daemon=True,
+        )
+        for i in range(ALERT_WORKERS)
+    ]
+    for worker in workers:
+        worker.start()
+    
+    try:
+        while any(worker.is_alive() for worker in workers):
+            time.sleep(1)
+    except KeyboardInterrupt:
+        logger.info("Shutting down (KeyboardInterrupt)")
+        stop.set()
+        # Let in-flight batches finish (a pending long poll returns within 20s)
+        for worker in workers:
+            worker.join(timeout=30)
 
 
 def main():
@@ -387,10 +773,12 @@ def main():
     # Check for test mode
     test_file = os.getenv("TEST_FILE")
     if test_file:
-        logger.info(f"Running in TEST mode with file: {test_file}")
+        logger.info("Running in TEST mode with file: %s", test_file)
         keywords_config = load_keywords()
-        logger.info(f"Global keywords: {sorted(keywords_config.get('global', set()))}")
-        logger.info(f"Commission keywords: {list(keywords_config.get('commissions', {}).keys())}")
+        if boto3:
+            s3_client()
+        logger.info("Global keywords: %s", sorted(keywords_config.get("global", set())))
+        logger.info("Commission keywords: %s", list(keywords_config.get("commissions", {}).keys()))
         
         # Create mock event
         event = {